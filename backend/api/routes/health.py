@@ -2,19 +2,23 @@
 Health check endpoint
 """
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from models.schemas import HealthResponse
 
 router = APIRouter()
 
+# The payload is constant, so serialize it once at import
+_HEALTH_JSON = orjson.dumps({
+    "status": "healthy",
+    "version": "0.1.0",
+    "service": "wealthpath-optimizer",
+})
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
     Health check endpoint for monitoring and load balancers.
     """
-    return HealthResponse(
-        status="healthy",
-        version="0.1.0",
-        service="wealthpath-optimizer"
-    )
+    return Response(content=_HEALTH_JSON, media_type="application/json")
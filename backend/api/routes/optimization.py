@@ -2,7 +2,10 @@
 Optimization API endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from itertools import starmap
 from typing import List
 
 from models.schemas import (
@@ -10,31 +13,85 @@ from models.schemas import (
     OptimizationResponse,
     PeriodData,
 )
-from core.optimizer import compute_optimization, OptimizationParams, BellmanOptimizer
+from core.optimizer import (
+    compute_optimization,
+    compute_optimization_batch,
+    compute_preview,
+    OptimizationParams,
+    OptimizationResult,
+)
 
 router = APIRouter()
 
 
+def _make_period(p, a, k, c, u, sv) -> PeriodData:
+    """Build one PeriodData row from aligned column values."""
+    # The data comes straight from our own optimizer, so model_construct
+    # skips re-validation
+    return PeriodData.model_construct(
+        period=int(p),
+        age=int(a),
+        capital=float(k),
+        consumption=float(c),
+        utility=float(u),
+        savings=float(sv),
+    )
+
+
+def _build_response(result: OptimizationResult) -> OptimizationResponse:
+    """Convert an OptimizationResult into the API response model."""
+    s = result.series
+
+    # Round each column once instead of calling round() per period
+    capital = np.round(s.capital, 2)
+    consumption = np.round(s.consumption, 2)
+    savings = np.round(s.savings, 2)
+
+    # starmap unpacks the zipped columns in C, with no intermediate
+    # per-period objects
+    series_data = list(starmap(
+        _make_period,
+        zip(s.period, s.age, capital, consumption, s.utility, savings),
+    ))
+
+    return OptimizationResponse.model_construct(
+        initial_consumption=round(result.initial_consumption, 2),
+        total_utility=result.total_utility,
+        final_capital=round(result.final_capital, 2),
+        horizon=result.horizon,
+        beta=round(result.beta, 6),
+        growth_rate=round(result.growth_rate, 6),
+        series=series_data,
+        avg_consumption=round(float(consumption.mean()), 2),
+        max_consumption=round(float(consumption.max()), 2),
+        min_consumption=round(float(consumption.min()), 2),
+    )
+
+
 @router.post("/optimize", response_model=OptimizationResponse)
-async def run_optimization(request: OptimizationRequest):
+def run_optimization(request: OptimizationRequest):
     """
     Run the consumption optimization model.
-    
+
     Computes the optimal consumption path using:
     - Bellman equation for dynamic programming
     - Euler equation for consumption smoothing
     - Transversality condition for bequest motive
-    
+
     Returns the complete time series of capital and consumption evolution.
+
+    Declared sync so Starlette runs it on the worker threadpool: the
+    optimization is pure CPU work and would otherwise block the event
+    loop for every concurrent request.
     """
+    # Validate life expectancy > current age
+    if request.life_expectancy <= request.current_age:
+        raise HTTPException(
+            status_code=400,
+            detail="Life expectancy must be greater than current age"
+        )
+
     try:
-        # Validate life expectancy > current age
-        if request.life_expectancy <= request.current_age:
-            raise HTTPException(
-                status_code=400,
-                detail="Life expectancy must be greater than current age"
-            )
-        
         # Run optimization
         result = compute_optimization(
             initial_capital=request.initial_capital,
@@ -46,34 +103,7 @@ async def run_optimization(request: OptimizationRequest):
             inheritance_target=request.inheritance_target,
         )
         
-        # Convert series to response format
-        series_data = [
-            PeriodData(
-                period=p.period,
-                age=p.age,
-                capital=round(p.capital, 2),
-                consumption=round(p.consumption, 2),
-                utility=p.utility,
-                savings=round(p.savings, 2),
-            )
-            for p in result.series
-        ]
-        
-        # Calculate summary statistics
-        consumptions = [p.consumption for p in result.series]
-        
-        return OptimizationResponse(
-            initial_consumption=round(result.initial_consumption, 2),
-            total_utility=result.total_utility,
-            final_capital=round(result.final_capital, 2),
-            horizon=result.horizon,
-            beta=round(result.beta, 6),
-            growth_rate=round(result.growth_rate, 6),
-            series=series_data,
-            avg_consumption=round(sum(consumptions) / len(consumptions), 2),
-            max_consumption=round(max(consumptions), 2),
-            min_consumption=round(min(consumptions), 2),
-        )
+        return _build_response(result)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -84,21 +114,63 @@ async def run_optimization(request: OptimizationRequest):
         )
 
 
-@router.post("/optimize/preview")
-async def preview_optimization(request: OptimizationRequest):
+@router.post("/optimize/batch", response_model=List[OptimizationResponse])
+def run_batch_optimization(requests: List[OptimizationRequest]):
     """
-    Quick preview of optimization without full series.
-    Returns only key metrics for faster response during slider adjustments.
+    Run many independent optimizations in a single call.
+
+    Intended for parameter sweeps, where the frontend fires off many
+    slightly-varying requests: all root-finding problems are solved in
+    one parallel compiled pass instead of one round trip each.
     """
-    try:
+    for request in requests:
         if request.life_expectancy <= request.current_age:
             raise HTTPException(
                 status_code=400,
                 detail="Life expectancy must be greater than current age"
             )
-        
-        # Create optimizer for quick calculations
-        params = OptimizationParams(
+
+    try:
+        params_list = [
+            OptimizationParams(
+                initial_capital=request.initial_capital,
+                annual_return=request.annual_return,
+                discount_rate=request.discount_rate,
+                risk_aversion=request.risk_aversion,
+                life_expectancy=request.life_expectancy,
+                current_age=request.current_age,
+                inheritance_target=request.inheritance_target,
+            )
+            for request in requests
+        ]
+
+        results = compute_optimization_batch(params_list)
+        return [_build_response(result) for result in results]
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch optimization failed: {str(e)}"
+        )
+
+
+@router.post("/optimize/preview")
+def preview_optimization(request: OptimizationRequest):
+    """
+    Quick preview of optimization without full series.
+    Returns only key metrics for faster response during slider adjustments.
+    """
+    if request.life_expectancy <= request.current_age:
+        raise HTTPException(
+            status_code=400,
+            detail="Life expectancy must be greater than current age"
+        )
+
+    try:
+        # Scalar fast path: no optimizer object needed for the preview
+        preview = compute_preview(
             initial_capital=request.initial_capital,
             annual_return=request.annual_return,
             discount_rate=request.discount_rate,
@@ -107,74 +179,82 @@ async def preview_optimization(request: OptimizationRequest):
             current_age=request.current_age,
             inheritance_target=request.inheritance_target,
         )
-        
-        optimizer = BellmanOptimizer(params)
-        c1 = optimizer.find_optimal_c1()
-        
+
         return {
-            "initial_consumption": round(c1, 2),
-            "beta": round(optimizer.beta, 6),
-            "growth_rate": round(optimizer.growth_rate, 6),
-            "horizon": optimizer.T,
+            "initial_consumption": round(preview["initial_consumption"], 2),
+            "beta": round(preview["beta"], 6),
+            "growth_rate": round(preview["growth_rate"], 6),
+            "horizon": preview["horizon"],
         }
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# The defaults payload is constant, so serialize it once at import
+_DEFAULTS_JSON = orjson.dumps({
+    "initial_capital": {
+        "default": 1000000,
+        "min": 1000,
+        "max": 100000000,
+        "step": 10000,
+        "description": "Initial capital/wealth (K₀)"
+    },
+    "annual_return": {
+        "default": 0.05,
+        "min": 0.001,
+        "max": 0.30,
+        "step": 0.005,
+        "description": "Annual return rate (r)"
+    },
+    "discount_rate": {
+        "default": 0.03,
+        "min": 0.001,
+        "max": 0.20,
+        "step": 0.005,
+        "description": "Time preference rate (ρ)"
+    },
+    "risk_aversion": {
+        "default": 2.0,
+        "min": 0.1,
+        "max": 10.0,
+        "step": 0.1,
+        "description": "CRRA risk aversion coefficient (σ)"
+    },
+    "life_expectancy": {
+        "default": 85,
+        "min": 50,
+        "max": 120,
+        "step": 1,
+        "description": "Expected lifespan (T)"
+    },
+    "current_age": {
+        "default": 35,
+        "min": 18,
+        "max": 100,
+        "step": 1,
+        "description": "Current age (t₀)"
+    },
+    "inheritance_target": {
+        "default": 200000,
+        "min": 0,
+        "max": 100000000,
+        "step": 10000,
+        "description": "Target bequest (K_T)"
+    }
+})
+
+
 @router.get("/parameters/defaults")
 async def get_default_parameters():
     """
     Get default parameter values for the optimization model.
+
+    Served from a precomputed JSON byte string with an hour of client
+    caching; the values never change at runtime.
     """
-    return {
-        "initial_capital": {
-            "default": 1000000,
-            "min": 1000,
-            "max": 100000000,
-            "step": 10000,
-            "description": "Initial capital/wealth (K₀)"
-        },
-        "annual_return": {
-            "default": 0.05,
-            "min": 0.001,
-            "max": 0.30,
-            "step": 0.005,
-            "description": "Annual return rate (r)"
-        },
-        "discount_rate": {
-            "default": 0.03,
-            "min": 0.001,
-            "max": 0.20,
-            "step": 0.005,
-            "description": "Time preference rate (ρ)"
-        },
-        "risk_aversion": {
-            "default": 2.0,
-            "min": 0.1,
-            "max": 10.0,
-            "step": 0.1,
-            "description": "CRRA risk aversion coefficient (σ)"
-        },
-        "life_expectancy": {
-            "default": 85,
-            "min": 50,
-            "max": 120,
-            "step": 1,
-            "description": "Expected lifespan (T)"
-        },
-        "current_age": {
-            "default": 35,
-            "min": 18,
-            "max": 100,
-            "step": 1,
-            "description": "Current age (t₀)"
-        },
-        "inheritance_target": {
-            "default": 200000,
-            "min": 0,
-            "max": 100000000,
-            "step": 10000,
-            "description": "Target bequest (K_T)"
-        }
-    }
+    return Response(
+        content=_DEFAULTS_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
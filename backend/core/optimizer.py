@@ -12,11 +12,189 @@ Mathematical Foundation:
 - Transversality: K_T = K_target (inheritance)
 """
 
+import threading
+
 import numpy as np
 from scipy.optimize import brentq
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Optional
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional at runtime
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernels run as plain Python without numba."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_final_K(K0: float, C1: float, r: float, growth: float, T: int) -> float:
+    """
+    JIT-compiled scalar recurrence returning only the final capital K_T.
+
+    Defined at module scope so numba compiles it once per process, not per
+    request. The consumption cap (C_t <= 0.99 * K_t) is applied exactly as
+    in the full simulation.
+    """
+    K = K0
+    C = C1
+    alpha = 1.0 + r
+    for _ in range(T):
+        actual = min(C, K * 0.99) if K > 0 else 0.0
+        K = (K - actual) * alpha
+        if K < 0:
+            K = 0.0
+        C = actual * growth
+    return K
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_series(K0, C1, r, growth, T, sigma, out_K, out_C, out_U):
+    """
+    JIT-compiled full-series recurrence writing capital, consumption and
+    utility into preallocated arrays of length T+1.
+    """
+    K = K0
+    C = C1
+    alpha = 1.0 + r
+    log_utility = abs(sigma - 1.0) < 1e-8
+    for t in range(T + 1):
+        actual = min(C, K * 0.99) if K > 0 else 0.0
+        out_K[t] = K
+        out_C[t] = actual
+        if actual <= 0:
+            out_U[t] = -np.inf
+        elif log_utility:
+            out_U[t] = np.log(actual)
+        else:
+            out_U[t] = actual ** (1.0 - sigma) / (1.0 - sigma)
+        if t < T:
+            K = (K - actual) * alpha
+            if K < 0:
+                K = 0.0
+            C = actual * growth
+    return out_K[T]
+
+
+@njit(cache=True)
+def _brentq_c1(K0, r, growth, K_target, T, xa, xb, xtol, maxiter):
+    """
+    Brent root finder for the transversality condition, compiled with the
+    simulation kernel so the objective never crosses back into Python.
+
+    Solves _simulate_final_K(K0, c1, ...) - K_target = 0 for c1 in
+    [xa, xb]. Port of scipy's brentq C implementation. Returns NaN when
+    the bracket does not contain a sign change.
+    """
+    rtol = 4 * 2.220446049250313e-16  # 4 * machine epsilon, as in scipy
+
+    xpre, xcur = xa, xb
+    fpre = _simulate_final_K(K0, xpre, r, growth, T) - K_target
+    fcur = _simulate_final_K(K0, xcur, r, growth, T) - K_target
+
+    if fpre == 0:
+        return xpre
+    if fcur == 0:
+        return xcur
+    # Compare signs without multiplying: the product of two tiny
+    # residuals can underflow to 0.0 and slip past a `> 0` test
+    if (fpre > 0.0) == (fcur > 0.0):
+        return np.nan
+
+    xblk = 0.0
+    fblk = 0.0
+    spre = 0.0
+    scur = 0.0
+
+    for _ in range(maxiter):
+        if (fpre > 0.0) != (fcur > 0.0):
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+
+        delta = (xtol + rtol * abs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta:
+            return xcur
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # Secant interpolation
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # Inverse quadratic extrapolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre = scur
+                scur = stry
+            else:
+                spre = sbis
+                scur = sbis
+        else:
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+
+        fcur = _simulate_final_K(K0, xcur, r, growth, T) - K_target
+
+    return xcur
+
+
+@njit(cache=True, parallel=True)
+def _batch_c1(K0_arr, r_arr, growth_arr, K_target_arr, T_arr, c1_min_arr, c1_max_arr, xtol, maxiter):
+    """
+    Solve the transversality root for a batch of independent parameter
+    sets, one compiled Brent solve per prange iteration.
+    """
+    n = K0_arr.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = _brentq_c1(
+            K0_arr[i], r_arr[i], growth_arr[i], K_target_arr[i],
+            T_arr[i], c1_min_arr[i], c1_max_arr[i], xtol, maxiter,
+        )
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT cache at import so the first request doesn't pay the
+    # compilation cost.
+    _simulate_final_K(1.0, 0.01, 0.05, 1.0, 1)
+    _simulate_series(
+        1.0, 0.01, 0.05, 1.0, 1, 2.0,
+        np.zeros(2), np.zeros(2), np.zeros(2),
+    )
+    _brentq_c1(1.0, 0.05, 1.0, 0.5, 1, 0.001, 0.9, 1e-8, 100)
+    _batch_c1(
+        np.ones(1), np.full(1, 0.05), np.ones(1), np.full(1, 0.5),
+        np.ones(1, dtype=np.int64), np.full(1, 0.001), np.full(1, 0.9),
+        1e-8, 100,
+    )
+
 
 @dataclass
 class OptimizationParams:
@@ -41,6 +219,43 @@ class PeriodResult:
     savings: float
 
 
+@dataclass
+class SeriesData:
+    """
+    Struct-of-arrays time series of the optimization.
+
+    Holds one NumPy column of length T+1 per field instead of a list of
+    per-period objects, so consumers can run vector operations directly
+    on the columns. Indexing and iteration yield PeriodResult views for
+    compatibility with per-period consumers.
+    """
+    period: np.ndarray
+    age: np.ndarray
+    capital: np.ndarray
+    consumption: np.ndarray
+    utility: np.ndarray
+    savings: np.ndarray
+
+    def __len__(self) -> int:
+        return self.period.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return PeriodResult(
+            period=int(self.period[index]),
+            age=int(self.age[index]),
+            capital=float(self.capital[index]),
+            consumption=float(self.consumption[index]),
+            utility=float(self.utility[index]),
+            savings=float(self.savings[index]),
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
 @dataclass
 class OptimizationResult:
     """Complete optimization results."""
@@ -50,7 +265,63 @@ class OptimizationResult:
     horizon: int                    # T: Number of periods
     beta: float                     # β = 1/(1+ρ): Discount factor
     growth_rate: float              # [β(1+r)]^(1/σ): Consumption growth
-    series: List[PeriodResult]      # Time series of results
+    series: SeriesData              # Time series of results (SoA columns)
+
+    @property
+    def capital_array(self) -> np.ndarray:
+        """Capital column of the series, for vector operations."""
+        return self.series.capital
+
+    @property
+    def consumption_array(self) -> np.ndarray:
+        """Consumption column of the series, for vector operations."""
+        return self.series.consumption
+
+
+# Warm-start cache: last solved c1 per discretized parameter set. During
+# slider adjustments consecutive requests repeat the same (rounded)
+# parameters, so the previous solution brackets the new root tightly.
+# The sync route handlers run on Starlette's worker threadpool, so every
+# access goes through _C1_CACHE_LOCK.
+_C1_CACHE: OrderedDict = OrderedDict()
+_C1_CACHE_MAXSIZE = 256
+_C1_CACHE_LOCK = threading.Lock()
+
+
+def _round_sig(x: float, digits: int = 4) -> float:
+    """Round to `digits` significant figures for cache keying."""
+    return float(f"{x:.{digits}g}")
+
+
+def _c1_cache_key(params: OptimizationParams) -> tuple:
+    """Discretized parameter tuple used to key the warm-start cache."""
+    return (
+        _round_sig(params.initial_capital),
+        _round_sig(params.annual_return),
+        _round_sig(params.discount_rate),
+        _round_sig(params.risk_aversion),
+        params.life_expectancy,
+        params.current_age,
+        _round_sig(params.inheritance_target),
+    )
+
+
+def _c1_cache_get(key: tuple) -> Optional[float]:
+    """Look up a previously solved c1, refreshing its recency."""
+    with _C1_CACHE_LOCK:
+        value = _C1_CACHE.get(key)
+        if value is not None:
+            _C1_CACHE.move_to_end(key)
+        return value
+
+
+def _c1_cache_put(key: tuple, value: float) -> None:
+    """Store a solved c1, evicting the least recently used entry."""
+    with _C1_CACHE_LOCK:
+        _C1_CACHE[key] = value
+        _C1_CACHE.move_to_end(key)
+        if len(_C1_CACHE) > _C1_CACHE_MAXSIZE:
+            _C1_CACHE.popitem(last=False)
 
 
 class BellmanOptimizer:
@@ -72,10 +343,15 @@ class BellmanOptimizer:
         
         # Calculate consumption growth rate from Euler equation
         # C_{t+1}/C_t = [β(1+r)]^(1/σ)
-        self.growth_rate = np.power(
-            self.beta * (1 + params.annual_return),
-            1 / params.risk_aversion
-        )
+        # Plain ** on scalars avoids NumPy ufunc dispatch overhead
+        self.growth_rate = (
+            self.beta * (1 + params.annual_return)
+        ) ** (1 / params.risk_aversion)
+
+        # σ is fixed for the whole optimization, so pick the utility
+        # branch once instead of np.isclose per period
+        self._log_utility = bool(np.isclose(params.risk_aversion, 1.0))
+        self._sigma_m1 = 1.0 - params.risk_aversion
     
     def crra_utility(self, consumption: float) -> float:
         """
@@ -84,104 +360,286 @@ class BellmanOptimizer:
         U(C) = C^(1-σ) / (1-σ)  if σ ≠ 1
         U(C) = ln(C)            if σ = 1 (log utility)
         """
-        sigma = self.params.risk_aversion
-        
         if consumption <= 0:
             return -np.inf
-        
-        if np.isclose(sigma, 1.0):
+
+        if self._log_utility:
             return np.log(consumption)
         else:
-            return np.power(consumption, 1 - sigma) / (1 - sigma)
+            return consumption ** self._sigma_m1 / self._sigma_m1
     
-    def simulate_path(self, initial_consumption: float) -> tuple[float, List[PeriodResult]]:
+    def _closed_form_path(self, initial_consumption: float) -> Optional[tuple]:
+        """
+        Evaluate the uncapped path in closed form as NumPy vectors.
+
+        The Euler path is geometric (C_t = C_1 * g^t) and capital follows a
+        linear recurrence K_{t+1} = (1+r)(K_t - C_t), so both trajectories
+        have closed forms:
+
+            K_t = α^t * K_0 - C_1 * α * (α^t - g^t) / (α - g),  α = 1 + r
+
+        (with the α = g limit K_t = α^t * (K_0 - t * C_1)). The closed
+        forms are only valid while capital stays positive and the
+        consumption cap (C_t <= 0.99 * K_t) never binds; returns None
+        otherwise so callers can fall back to the capped scalar loop.
+
+        Returns:
+            Tuple of (t, C, K) arrays of length T+1, or None
+        """
+        if initial_consumption <= 0:
+            return None
+
+        g = self.growth_rate
+        alpha = 1 + self.params.annual_return
+        K0 = self.params.initial_capital
+
+        t = np.arange(self.T + 1)
+        C = initial_consumption * np.power(g, t)
+        alpha_t = np.power(alpha, t)
+
+        if np.isclose(alpha, g):
+            K = alpha_t * (K0 - initial_consumption * t)
+        else:
+            K = alpha_t * K0 - initial_consumption * alpha * (alpha_t - np.power(g, t)) / (alpha - g)
+
+        if not (np.all(K > 0) and np.all(C <= K * 0.99)):
+            return None
+
+        return t, C, K
+
+    def simulate_path(self, initial_consumption: float) -> tuple[float, SeriesData]:
         """
         Simulate the consumption and capital path given initial consumption.
-        
+
+        Evaluates the closed-form trajectories where valid, with the scalar
+        loop as a fallback for the rare case where the consumption cap binds.
+
         Returns:
             Tuple of (final_capital, series)
         """
-        K = self.params.initial_capital
-        C = initial_consumption
-        r = self.params.annual_return
-        
-        series = []
-        
-        for t in range(self.T + 1):
-            # Ensure consumption doesn't exceed capital
-            actual_consumption = min(C, K * 0.99) if K > 0 else 0
-            
-            # Calculate utility
-            utility = self.crra_utility(actual_consumption)
-            
-            # Store period result
-            series.append(PeriodResult(
-                period=t,
-                age=self.params.current_age + t,
-                capital=K,
-                consumption=actual_consumption,
-                utility=utility,
-                savings=K - actual_consumption if K > actual_consumption else 0
-            ))
-            
-            # State transition: K_{t+1} = (1+r)(K_t - C_t)
-            if t < self.T:
-                K = (K - actual_consumption) * (1 + r)
-                K = max(K, 0)  # Capital cannot go negative
-                
-                # Apply Euler equation for next period consumption
-                C = actual_consumption * self.growth_rate
-        
-        return K, series
+        path = self._closed_form_path(initial_consumption)
+        if path is None:
+            return self._simulate_path_loop(initial_consumption)
+        t, C, K = path
+
+        if self._log_utility:
+            U = np.log(C)
+        else:
+            U = C ** self._sigma_m1 / self._sigma_m1
+
+        series = SeriesData(
+            period=t,
+            age=self.params.current_age + t,
+            capital=K,
+            consumption=C,
+            utility=U,
+            savings=K - C,
+        )
+
+        return float(K[-1]), series
+
+    def _simulate_path_loop(self, initial_consumption: float) -> tuple[float, SeriesData]:
+        """
+        Scalar fallback simulation, used when the consumption cap binds.
+
+        The per-period recurrence runs inside the compiled _simulate_series
+        kernel; only the PeriodResult assembly stays in Python.
+        """
+        n = self.T + 1
+        K = np.empty(n)
+        C = np.empty(n)
+        U = np.empty(n)
+
+        final_K = _simulate_series(
+            self.params.initial_capital,
+            initial_consumption,
+            self.params.annual_return,
+            self.growth_rate,
+            self.T,
+            self.params.risk_aversion,
+            K, C, U,
+        )
+
+        t = np.arange(n)
+        series = SeriesData(
+            period=t,
+            age=self.params.current_age + t,
+            capital=K,
+            consumption=C,
+            utility=U,
+            savings=np.where(K > C, K - C, 0.0),
+        )
+
+        return float(final_K), series
     
+    def _final_capital(self, initial_consumption: float) -> float:
+        """
+        Compute only the final capital K_T for a given initial consumption.
+
+        This is the hot path for root finding: `find_optimal_c1` evaluates
+        the transversality objective many times and only needs the scalar
+        K_T, so building the full PeriodResult series would be wasted
+        allocation. Uses the same closed form as `simulate_path`, with a
+        tight scalar loop as fallback when the consumption cap binds.
+        """
+        path = self._closed_form_path(initial_consumption)
+        if path is not None:
+            return float(path[2][-1])
+
+        # Cap binds somewhere: replay the capped recurrence in the compiled
+        # kernel without building any per-period objects.
+        return float(_simulate_final_K(
+            self.params.initial_capital, initial_consumption,
+            self.params.annual_return, self.growth_rate, self.T,
+        ))
+
+    def _analytic_c1(self) -> Optional[float]:
+        """
+        Closed-form solution of K_T(c1) = K_target for the uncapped model.
+
+        K_T is linear and strictly decreasing in c1 (more consumption
+        leaves less capital), so while the consumption cap never binds
+
+            c1 = (α^T * K_0 - K_target) * (α - g) / (α * (α^T - g^T))
+
+        is the exact root (α = g limit: c1 = (K_0 - K_target / α^T) / T).
+        Returns None for a degenerate horizon or a non-positive solution.
+        """
+        g = self.growth_rate
+        alpha = 1 + self.params.annual_return
+        K0 = self.params.initial_capital
+        K_target = self.params.inheritance_target
+        T = self.T
+
+        if T <= 0:
+            return None
+
+        alpha_T = alpha ** T
+        if np.isclose(alpha, g):
+            c1 = (K0 - K_target / alpha_T) / T
+        else:
+            c1 = (alpha_T * K0 - K_target) * (alpha - g) / (alpha * (alpha_T - g ** T))
+
+        return c1 if c1 > 0 else None
+
+    def _solve_c1(self, c1_min: float, c1_max: float) -> Optional[float]:
+        """
+        Run Brent's method on [c1_min, c1_max] for the transversality root.
+
+        The compiled solver keeps the objective inside machine code;
+        scipy's brentq is the fallback without numba. Returns None when
+        the bracket does not contain a sign change.
+
+        Convergence stops once the c1 precision maps to sub-cent final
+        capital: results are reported in dollars and cents, so iterating
+        down to 1e-8 would be ~9 orders of magnitude tighter than the
+        output can show.
+        """
+        K_target = self.params.inheritance_target
+
+        # |dK_T/dc1| = α(α^T - g^T)/(α - g): how many dollars of final
+        # capital one dollar of initial consumption moves
+        alpha = 1 + self.params.annual_return
+        g = self.growth_rate
+        if np.isclose(alpha, g):
+            sensitivity = self.T * alpha ** self.T
+        else:
+            sensitivity = alpha * (alpha ** self.T - g ** self.T) / (alpha - g)
+        xtol = max(0.01 / max(sensitivity, 1.0), 1e-10)
+
+        if NUMBA_AVAILABLE:
+            c1 = _brentq_c1(
+                self.params.initial_capital, self.params.annual_return,
+                self.growth_rate, K_target, self.T,
+                c1_min, c1_max, xtol, 30,
+            )
+            return float(c1) if np.isfinite(c1) else None
+
+        try:
+            return brentq(
+                lambda c1: self._final_capital(c1) - K_target,
+                c1_min, c1_max, xtol=xtol, maxiter=30,
+            )
+        except ValueError:
+            return None
+
+    def _accept_c1(self, c1: Optional[float]) -> bool:
+        """
+        Whether a solver result is good enough to cache and return.
+
+        Brent can hand back a spurious root when the bracket was bad, so
+        accept only a positive c1 that lands the final capital within the
+        $1 the bisection fallback guarantees.
+        """
+        if c1 is None or c1 <= 0:
+            return False
+        return abs(self._final_capital(c1) - self.params.inheritance_target) < 1
+
     def find_optimal_c1(self) -> float:
         """
         Find optimal initial consumption C_1 using the transversality condition.
-        
+
         Solves: Find C_1 such that K_T = K_target (inheritance target)
-        
-        Uses Brent's method for root finding within bounds.
+
+        The uncapped model is fully analytic, so for realistic parameters
+        the root comes straight from the closed form with zero iterations;
+        Brent's method only runs when the consumption cap actually binds,
+        warm-started from the last solution for the same discretized
+        parameters.
         """
         K0 = self.params.initial_capital
         K_target = self.params.inheritance_target
-        
-        def objective(c1: float) -> float:
-            """Objective function: difference between final capital and target."""
-            final_capital, _ = self.simulate_path(c1)
-            return final_capital - K_target
-        
+
+        # Closed-form fast path: exact when the consumption cap never
+        # binds along the implied trajectory
+        c1_guess = self._analytic_c1()
+        if c1_guess is not None:
+            path = self._closed_form_path(c1_guess)
+            if path is not None and abs(float(path[2][-1]) - K_target) < 0.01:
+                return c1_guess
+
+        # Warm start: if these (rounded) parameters were solved before, a
+        # tight bracket around the previous solution converges in a few
+        # iterations instead of ~20
+        key = _c1_cache_key(self.params)
+        warm = _c1_cache_get(key)
+        if warm is not None:
+            c1_optimal = self._solve_c1(warm * 0.95, warm * 1.05)
+            if self._accept_c1(c1_optimal):
+                _c1_cache_put(key, c1_optimal)
+                return c1_optimal
+
         # Set bounds for initial consumption
         # Lower bound: very small consumption (results in high final capital)
         # Upper bound: consuming almost all (results in low final capital)
         c1_min = K0 * 0.001  # 0.1% of initial capital
         c1_max = K0 * 0.50   # 50% of initial capital
-        
-        # Check if solution exists within bounds
-        try:
-            f_min = objective(c1_min)
-            f_max = objective(c1_max)
-            
-            # If signs are the same, adjust bounds
-            if f_min * f_max > 0:
-                if f_min > 0 and f_max > 0:
-                    # Both result in too much final capital
-                    # Need to consume more - find upper bound
-                    for mult in [0.6, 0.7, 0.8, 0.9]:
-                        c1_max = K0 * mult
-                        if objective(c1_max) < 0:
-                            break
-                else:
-                    # Both result in too little final capital
-                    # Need to consume less
-                    c1_min = K0 * 0.0001
-            
-            # Find the root
-            c1_optimal = brentq(objective, c1_min, c1_max, xtol=1e-8, maxiter=100)
-            
-        except ValueError:
-            # If Brent's method fails, use a simple iterative approach
+
+        f_min = self._final_capital(c1_min) - K_target
+        f_max = self._final_capital(c1_max) - K_target
+
+        # If signs are the same, re-bracket. K_T is strictly decreasing in
+        # c1, so the analytic (uncapped) root pinpoints a tight bracket
+        # directly instead of stepping the upper bound outward. Compare
+        # signs rather than the product, which can underflow to 0.0 for
+        # long horizons and masquerade as a valid bracket.
+        if (f_min > 0.0) == (f_max > 0.0):
+            guess = self._analytic_c1()
+            if guess is not None:
+                c1_min = guess * 0.5
+                c1_max = min(guess * 1.5, K0 * 0.99)
+            else:
+                # Target unreachable even without consuming: the best we
+                # can do is consume next to nothing
+                c1_min = K0 * 0.0001
+
+        c1_optimal = self._solve_c1(c1_min, c1_max)
+        if not self._accept_c1(c1_optimal):
+            # If Brent's method fails or lands off target, degrade to the
+            # simple iterative approach
             c1_optimal = self._iterative_solver()
-        
+
+        _c1_cache_put(key, c1_optimal)
         return c1_optimal
     
     def _iterative_solver(self, max_iter: int = 100) -> float:
@@ -196,7 +654,7 @@ class BellmanOptimizer:
         
         for _ in range(max_iter):
             mid = (low + high) / 2
-            final_K, _ = self.simulate_path(mid)
+            final_K = self._final_capital(mid)
             
             if abs(final_K - K_target) < 1:  # Within $1
                 return mid
@@ -212,18 +670,20 @@ class BellmanOptimizer:
         """
         Run the full optimization and return complete results.
         """
-        # Find optimal initial consumption
-        c1_optimal = self.find_optimal_c1()
-        
+        return self._build_result(self.find_optimal_c1())
+
+    def _build_result(self, c1_optimal: float) -> OptimizationResult:
+        """
+        Assemble the OptimizationResult for an already-solved c1.
+        """
         # Simulate the optimal path
         final_capital, series = self.simulate_path(c1_optimal)
         
-        # Calculate total discounted utility
-        total_utility = sum(
-            np.power(self.beta, p.period) * p.utility
-            for p in series
-            if not np.isinf(p.utility)
-        )
+        # Calculate total discounted utility as one vector reduction,
+        # skipping the -inf periods where consumption hit zero
+        discount = self.beta ** series.period
+        finite = np.isfinite(series.utility)
+        total_utility = float((discount[finite] * series.utility[finite]).sum())
         
         return OptimizationResult(
             initial_consumption=c1_optimal,
@@ -274,6 +734,106 @@ def compute_optimization(
     return optimizer.optimize()
 
 
+def compute_preview(
+    initial_capital: float = 1000000,
+    annual_return: float = 0.05,
+    discount_rate: float = 0.03,
+    risk_aversion: float = 2.0,
+    life_expectancy: int = 85,
+    current_age: int = 35,
+    inheritance_target: float = 200000
+) -> dict:
+    """
+    Compute the preview metrics without constructing a BellmanOptimizer.
+
+    Slider adjustments call this at interactive rates, so everything is
+    plain scalar math: horizon, discount factor, Euler growth rate and
+    the closed-form c1, verified with a single compiled kernel call. The
+    full solver only runs when the consumption cap bends the trajectory
+    away from the analytic solution.
+
+    Returns:
+        Dict with initial_consumption, beta, growth_rate and horizon
+    """
+    T = life_expectancy - current_age
+    beta = 1 / (1 + discount_rate)
+    alpha = 1 + annual_return
+    growth = (beta * alpha) ** (1 / risk_aversion)
+
+    c1 = None
+    if T > 0:
+        alpha_T = alpha ** T
+        if np.isclose(alpha, growth):
+            c1 = (initial_capital - inheritance_target / alpha_T) / T
+        else:
+            c1 = (alpha_T * initial_capital - inheritance_target) * (alpha - growth) / (alpha * (alpha_T - growth ** T))
+
+    if c1 is not None and c1 > 0:
+        # The capped kernel reproduces the analytic K_T only when the cap
+        # never binds, so one scalar call doubles as verification
+        final_K = float(_simulate_final_K(initial_capital, c1, annual_return, growth, T))
+        if abs(final_K - inheritance_target) >= 0.01:
+            c1 = None
+    else:
+        c1 = None
+
+    if c1 is None:
+        params = OptimizationParams(
+            initial_capital=initial_capital,
+            annual_return=annual_return,
+            discount_rate=discount_rate,
+            risk_aversion=risk_aversion,
+            life_expectancy=life_expectancy,
+            current_age=current_age,
+            inheritance_target=inheritance_target
+        )
+        c1 = BellmanOptimizer(params).find_optimal_c1()
+
+    return {
+        "initial_consumption": c1,
+        "beta": beta,
+        "growth_rate": growth,
+        "horizon": T,
+    }
+
+
+def compute_optimization_batch(params_list: List[OptimizationParams]) -> List[OptimizationResult]:
+    """
+    Run many independent optimizations in one parallel compiled pass.
+
+    All transversality roots are solved by the prange batch kernel when
+    numba is available; items it cannot bracket fall back to the regular
+    per-item solver. Without numba the items are solved sequentially.
+
+    Args:
+        params_list: One OptimizationParams per independent problem
+
+    Returns:
+        One OptimizationResult per input, in the same order
+    """
+    optimizers = [BellmanOptimizer(params) for params in params_list]
+
+    if not (NUMBA_AVAILABLE and optimizers):
+        return [optimizer.optimize() for optimizer in optimizers]
+
+    K0 = np.array([o.params.initial_capital for o in optimizers])
+    r = np.array([o.params.annual_return for o in optimizers])
+    growth = np.array([o.growth_rate for o in optimizers])
+    K_target = np.array([o.params.inheritance_target for o in optimizers])
+    T = np.array([o.T for o in optimizers], dtype=np.int64)
+
+    c1s = _batch_c1(K0, r, growth, K_target, T, K0 * 0.001, K0 * 0.50, 1e-8, 100)
+
+    results = []
+    for optimizer, c1 in zip(optimizers, c1s):
+        if not np.isfinite(c1):
+            # Default bracket had no sign change; use the full solver
+            c1 = optimizer.find_optimal_c1()
+        results.append(optimizer._build_result(float(c1)))
+
+    return results
+
+
 # Example usage
 if __name__ == "__main__":
     result = compute_optimization()
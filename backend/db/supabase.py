@@ -3,36 +3,62 @@ Supabase database connection and utilities
 """
 
 import os
+import threading
 from supabase import create_client, Client
 from typing import Optional
 
+# Credentials are resolved once at import instead of hitting os.environ on
+# every (re)initialization; use SupabaseDB.configure() to override them.
+_SUPABASE_URL = os.getenv("SUPABASE_URL")
+_SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
+
 
 class SupabaseDB:
     """Supabase database connection manager."""
-    
+
     _instance: Optional[Client] = None
-    
+    _lock = threading.Lock()
+    _url: Optional[str] = _SUPABASE_URL
+    _key: Optional[str] = _SUPABASE_KEY
+
     @classmethod
     def get_client(cls) -> Client:
-        """Get or create Supabase client instance."""
+        """
+        Get or create Supabase client instance.
+
+        Uses double-checked locking: requests now run on a threadpool, so
+        without the lock concurrent first calls could each spawn their own
+        client (and its HTTP handshake). The hot path after initialization
+        stays lock-free.
+        """
         if cls._instance is None:
-            url = os.getenv("SUPABASE_URL")
-            key = os.getenv("SUPABASE_SERVICE_KEY")
-            
-            if not url or not key:
-                raise ValueError(
-                    "SUPABASE_URL and SUPABASE_SERVICE_KEY environment "
-                    "variables must be set"
-                )
-            
-            cls._instance = create_client(url, key)
-        
+            with cls._lock:
+                if cls._instance is None:
+                    if not cls._url or not cls._key:
+                        raise ValueError(
+                            "SUPABASE_URL and SUPABASE_SERVICE_KEY environment "
+                            "variables must be set"
+                        )
+
+                    cls._instance = create_client(cls._url, cls._key)
+
         return cls._instance
     
+    @classmethod
+    def configure(cls, url: str, key: str):
+        """Override the captured credentials (useful for testing)."""
+        with cls._lock:
+            cls._url = url
+            cls._key = key
+            cls._instance = None
+
     @classmethod
     def reset(cls):
-        """Reset the client instance (useful for testing)."""
-        cls._instance = None
+        """Reset the client and restore the import-time credentials."""
+        with cls._lock:
+            cls._instance = None
+            cls._url = _SUPABASE_URL
+            cls._key = _SUPABASE_KEY
 
 
 def get_db() -> Client:
@@ -100,11 +126,15 @@ async def delete_estimator(client: Client, estimator_id: str):
 
 # Optimization series operations
 async def save_optimization_series(client: Client, estimator_id: str, series: list):
-    """Save optimization series results."""
-    # Delete existing series for this estimator
-    client.table("optimization_series").delete().eq("estimator_id", estimator_id).execute()
-    
-    # Insert new series
+    """
+    Save optimization series results.
+
+    Upserts on the (estimator_id, period) unique key so existing rows are
+    overwritten in place rather than deleted and re-inserted. A second
+    statement still runs on every call to clear rows past the new
+    horizon; it only touches rows when the series shrank, but the round
+    trip itself is unconditional.
+    """
     series_data = [
         {
             "estimator_id": estimator_id,
@@ -115,8 +145,23 @@ async def save_optimization_series(client: Client, estimator_id: str, series: li
         }
         for item in series
     ]
-    
-    response = client.table("optimization_series").insert(series_data).execute()
+
+    response = (
+        client.table("optimization_series")
+        .upsert(series_data, on_conflict="estimator_id,period")
+        .execute()
+    )
+
+    # Clear stale periods beyond the new horizon (shorter life expectancy)
+    max_period = max(item["period"] for item in series) if series else -1
+    (
+        client.table("optimization_series")
+        .delete()
+        .eq("estimator_id", estimator_id)
+        .gt("period", max_period)
+        .execute()
+    )
+
     return response.data
 
 
@@ -57,6 +57,15 @@ class TestOptimizationEndpoint:
         response = client.post("/api/v1/optimize", json=params)
         assert response.status_code == 400
 
+    def test_optimize_batch(self, client):
+        """Test batch optimization returns one result per request."""
+        params = [{}, {"annual_return": 0.08}]
+        response = client.post("/api/v1/optimize/batch", json=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert data[1]["initial_consumption"] > data[0]["initial_consumption"]
+
     def test_preview_endpoint(self, client):
         """Test quick preview endpoint."""
         response = client.post("/api/v1/optimize/preview", json={})
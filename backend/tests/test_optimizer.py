@@ -1,8 +1,16 @@
 """
 Tests for the optimization engine
+
+Style note: float truth-checks use math.isclose / math.isnan rather than
+pytest.approx, which allocates a wrapper object per evaluation; keep
+approx for cases where its diff reporting is actually wanted.
 """
 
+import math
+
+import numpy as np
 import pytest
+from dataclasses import asdict
 from core.optimizer import (
     BellmanOptimizer,
     OptimizationParams,
@@ -10,121 +18,123 @@ from core.optimizer import (
 )
 
 
-@pytest.fixture
-def default_params():
-    return OptimizationParams(
-        initial_capital=1000000,
-        annual_return=0.05,
-        discount_rate=0.03,
-        risk_aversion=2.0,
-        life_expectancy=85,
-        current_age=35,
-        inheritance_target=200000,
-    )
+# Frozen once at import; tests that vary a field should use
+# dataclasses.replace(DEFAULT_PARAMS, ...) rather than mutating it
+DEFAULT_PARAMS = OptimizationParams(
+    initial_capital=1000000,
+    annual_return=0.05,
+    discount_rate=0.03,
+    risk_aversion=2.0,
+    life_expectancy=85,
+    current_age=35,
+    inheritance_target=200000,
+)
+
+
+@pytest.fixture(scope="session")
+def default_optimizer():
+    """One optimizer shared by the tests that only inspect derived values."""
+    return BellmanOptimizer(DEFAULT_PARAMS)
+
+
+@pytest.fixture(scope="session")
+def default_result():
+    """One full default-parameter solve shared across the suite."""
+    return compute_optimization(**asdict(DEFAULT_PARAMS))
+
+
+@pytest.fixture(scope="session")
+def solves_by_return():
+    """Solves keyed by annual return, shared by the monotonicity tests."""
+    return {r: compute_optimization(annual_return=r) for r in (0.03, 0.05, 0.08)}
+
+
+@pytest.fixture(scope="session")
+def solves_by_bequest():
+    """Solves keyed by inheritance target, shared by the bequest tests."""
+    return {k: compute_optimization(inheritance_target=k) for k in (0, 500000)}
+
+
+@pytest.fixture(scope="session")
+def solves_by_risk_aversion():
+    """Solves keyed by risk aversion, shared by the smoothness tests."""
+    return {ra: compute_optimization(risk_aversion=ra) for ra in (1.5, 2.0, 5.0)}
 
 
 class TestBellmanOptimizer:
-    def test_creates_optimizer(self, default_params):
-        """Test optimizer creation with valid parameters."""
-        optimizer = BellmanOptimizer(default_params)
-        assert optimizer.T == 50  # 85 - 35
-        assert optimizer.beta < 1
-        assert optimizer.growth_rate > 0
-
-    def test_beta_calculation(self, default_params):
-        """Test discount factor calculation: β = 1/(1+ρ)"""
-        optimizer = BellmanOptimizer(default_params)
-        expected_beta = 1 / (1 + 0.03)
-        assert abs(optimizer.beta - expected_beta) < 1e-10
+    def test_default_derived_quantities(self, default_optimizer):
+        """Optimizer-derived quantities: horizon, β = 1/(1+ρ), Euler growth.
 
-    def test_growth_rate_positive(self, default_params):
-        """Test that consumption growth rate is positive."""
-        optimizer = BellmanOptimizer(default_params)
-        assert optimizer.growth_rate > 0
+        No solve involved, so this stays in the -m 'not slow' smoke subset.
+        """
+        assert default_optimizer.T == 50  # 85 - 35
+        assert default_optimizer.beta < 1
+        expected_beta = 1 / (1 + 0.03)
+        assert math.isclose(default_optimizer.beta, expected_beta, rel_tol=0, abs_tol=1e-10)
+        assert default_optimizer.growth_rate > 0
+
+    @pytest.mark.slow
+    def test_default_solution_properties(self, default_result):
+        """All invariants of the shared default-parameter solve in one pass.
+
+        Consolidated so the assertions share one fixture resolution and one
+        report entry instead of several microsecond test bodies.
+        """
+        # The solve produced a valid series with positive consumption
+        assert default_result.initial_consumption > 0
+        assert default_result.series is not None
+        assert len(default_result.series) > 0
+
+        # Capital never goes negative
+        assert np.all(default_result.capital_array >= 0)
+
+        # Transversality: final capital approximately equals the
+        # inheritance target (allow for numerical precision error)
+        tolerance = abs(DEFAULT_PARAMS.inheritance_target * 0.01) + 100
+        assert math.isclose(
+            default_result.final_capital,
+            DEFAULT_PARAMS.inheritance_target,
+            rel_tol=0,
+            abs_tol=tolerance,
+        )
 
-    def test_crra_utility_positive_consumption(self, default_params):
+    def test_crra_utility_positive_consumption(self, default_optimizer):
         """Test CRRA utility with positive consumption."""
-        optimizer = BellmanOptimizer(default_params)
-        utility = optimizer.crra_utility(50000)
+        utility = default_optimizer.crra_utility(50000)
         assert utility != float('-inf')
-        assert not pytest.approx(utility, nan_ok=False) != utility
+        assert not math.isnan(utility)
 
-    def test_crra_utility_zero_consumption(self, default_params):
+    def test_crra_utility_zero_consumption(self, default_optimizer):
         """Test CRRA utility with zero consumption returns -inf."""
-        optimizer = BellmanOptimizer(default_params)
-        utility = optimizer.crra_utility(0)
+        utility = default_optimizer.crra_utility(0)
         assert utility == float('-inf')
 
-    def test_simulate_path_length(self, default_params):
+    def test_simulate_path_length(self, default_optimizer):
         """Test that simulation produces correct number of periods."""
-        optimizer = BellmanOptimizer(default_params)
-        _, series = optimizer.simulate_path(50000)
-        assert len(series) == optimizer.T + 1
-
-    def test_optimize_finds_solution(self, default_params):
-        """Test that optimization finds a valid solution."""
-        result = compute_optimization(
-            initial_capital=default_params.initial_capital,
-            annual_return=default_params.annual_return,
-            discount_rate=default_params.discount_rate,
-            risk_aversion=default_params.risk_aversion,
-            life_expectancy=default_params.life_expectancy,
-            current_age=default_params.current_age,
-            inheritance_target=default_params.inheritance_target,
-        )
-        
-        assert result.initial_consumption > 0
-        assert result.series is not None
-        assert len(result.series) > 0
+        _, series = default_optimizer.simulate_path(50000)
+        assert len(series) == default_optimizer.T + 1
 
-    def test_transversality_condition(self, default_params):
-        """Test that final capital approximately equals inheritance target."""
-        result = compute_optimization(
-            initial_capital=default_params.initial_capital,
-            annual_return=default_params.annual_return,
-            discount_rate=default_params.discount_rate,
-            risk_aversion=default_params.risk_aversion,
-            life_expectancy=default_params.life_expectancy,
-            current_age=default_params.current_age,
-            inheritance_target=default_params.inheritance_target,
-        )
-        
-        # Allow for numerical precision error
-        tolerance = abs(default_params.inheritance_target * 0.01) + 100
-        assert abs(result.final_capital - default_params.inheritance_target) < tolerance
-
-    def test_higher_return_increases_consumption(self, default_params):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("r_lo,r_hi", [(0.03, 0.05), (0.05, 0.08)])
+    def test_higher_return_increases_consumption(self, solves_by_return, r_lo, r_hi):
         """Test that higher return allows for higher consumption."""
-        result_low = compute_optimization(annual_return=0.03)
-        result_high = compute_optimization(annual_return=0.08)
-        
-        assert result_high.initial_consumption > result_low.initial_consumption
-
-    def test_capital_stays_positive(self, default_params):
-        """Test that capital never goes negative."""
-        result = compute_optimization(
-            initial_capital=default_params.initial_capital,
-            annual_return=default_params.annual_return,
-            discount_rate=default_params.discount_rate,
-            risk_aversion=default_params.risk_aversion,
-            life_expectancy=default_params.life_expectancy,
-            current_age=default_params.current_age,
-            inheritance_target=default_params.inheritance_target,
+        assert (
+            solves_by_return[r_hi].initial_consumption
+            > solves_by_return[r_lo].initial_consumption
         )
-        
-        for period in result.series:
-            assert period.capital >= 0
 
 
 class TestEdgeCases:
-    def test_zero_inheritance_target(self):
+    @pytest.mark.slow
+    def test_zero_inheritance_target(self, solves_by_bequest):
         """Test optimization with zero bequest motive."""
-        result = compute_optimization(inheritance_target=0)
+        result = solves_by_bequest[0]
         assert result.initial_consumption > 0
         # With zero inheritance, should consume more
-        result_bequest = compute_optimization(inheritance_target=500000)
+        result_bequest = solves_by_bequest[500000]
         assert result.initial_consumption > result_bequest.initial_consumption
 
+    @pytest.mark.slow
     def test_short_horizon(self):
         """Test optimization with short horizon."""
         result = compute_optimization(
@@ -135,18 +145,14 @@ class TestEdgeCases:
         assert result.horizon == 5
         assert result.initial_consumption > 0
 
-    def test_high_risk_aversion(self):
+    @pytest.mark.slow
+    def test_high_risk_aversion(self, solves_by_risk_aversion):
         """Test with high risk aversion (smoother consumption)."""
-        result = compute_optimization(risk_aversion=5.0)
-        
-        # High risk aversion should lead to less variable consumption
-        consumptions = [p.consumption for p in result.series]
-        std_dev = (sum((c - sum(consumptions)/len(consumptions))**2 for c in consumptions) / len(consumptions)) ** 0.5
-        
-        result_low = compute_optimization(risk_aversion=1.5)
-        consumptions_low = [p.consumption for p in result_low.series]
-        std_dev_low = (sum((c - sum(consumptions_low)/len(consumptions_low))**2 for c in consumptions_low) / len(consumptions_low)) ** 0.5
-        
+        # High risk aversion should lead to less variable consumption;
+        # the consumption column is already an ndarray, so reduce in C
+        std_dev = solves_by_risk_aversion[5.0].consumption_array.std()
+        std_dev_low = solves_by_risk_aversion[1.5].consumption_array.std()
+
         # Lower risk aversion should have more variation
         assert std_dev < std_dev_low
 